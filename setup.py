@@ -78,6 +78,8 @@ install_requires = [
 
 extras_require = {
     "test": ["pytest"],
+    # faster (de)serialization of models and circuits in simphony.formatters
+    "json": ["orjson"],
 }
 
 if "setuptools" in sys.modules:
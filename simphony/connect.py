@@ -81,25 +81,29 @@ def connect_s(A, k, B, l):
     return innerconnect_s(C, k, nA + l)
 
 
-def create_block_diagonal(A, B):
-    """merges an fxnxn(x2) matrix with an fxmxm(x2) matrix to form a fx(n+m)x(n+m)(x2)
-    block diagonal matrix."""
-    nf = A.shape[0]  # num frequency points
-    nA = A.shape[1]  # num ports on A
-    nB = B.shape[1]  # num ports on B
-    nC = nA + nB  # num ports on C
+def create_block_diagonal(*matrices):
+    """merges fxnxn(x2) matrices (e.g. an fxnxn(x2) matrix with an fxmxm(x2)
+    matrix) to form a fx(n+m)x(n+m)x2 block diagonal matrix.
 
+    The composite matrix is allocated once and every sub-matrix is copied
+    into place, so merging many matrices at once avoids reallocating the
+    growing matrix for each one."""
     # if complex values are in rectangular, convert to polar
-    if A.ndim == 3:
-        A = np.stack((np.abs(A), np.angle(A)), axis=-1)
+    matrices = [
+        np.stack((np.abs(M), np.angle(M)), axis=-1) if M.ndim == 3 else M
+        for M in matrices
+    ]
 
-    if B.ndim == 3:
-        B = np.stack((np.abs(B), np.angle(B)), axis=-1)
+    nf = matrices[0].shape[0]  # num frequency points
+    nC = sum(M.shape[1] for M in matrices)  # num ports on C
 
     # create composite matrix, appending each sub-matrix diagonally
     C = np.zeros((nf, nC, nC, 2))
-    C[:, :nA, :nA] = A.copy()
-    C[:, nA:, nA:] = B.copy()
+    start = 0
+    for M in matrices:
+        stop = start + M.shape[1]
+        C[:, start:stop, start:stop] = M
+        start = stop
 
     return C
 
@@ -128,6 +132,11 @@ def innerconnect_s(S, k, l):
     The algorithm used to calculate the resultant network is called a
     'sub-network growth',  can be found in [#]_. The original paper
     describing the  algorithm is given in [#]_.
+
+    The closed-form solution ``S = (X* - C)^-1`` of the whole circuit is
+    not used here: the matrices are stored in polar form and every addition
+    carries the unwrapped phase forward, which a single linear solve on the
+    rectangular matrix would discard.
     References
     ----------
     .. [#] Compton, R.C.; , "Perspectives in microwave circuit analysis," Circuits and Systems, 1989., Proceedings of the 32nd Midwest Symposium on , vol., no., pp.716-718 vol.2, 14-16 Aug 1989. URL: http://ieeexplore.ieee.org/stamp/stamp.jsp?tp=&arnumber=101955&isnumber=3167
@@ -137,33 +146,36 @@ def innerconnect_s(S, k, l):
     if k > S.shape[1] - 1 or l > S.shape[1] - 1:
         raise (ValueError("port indices are out of range"))
 
-    nS = S.shape[1]  # num of ports on input s-matrix
-    # create an empty s-matrix, to store the result
-    C = np.zeros(S.shape)
-
-    # loop through ports and calulates resultant s-parameters
-    for h in range(S.shape[0]):
-        for i in range(nS):
-            for j in range(nS):
-                term1 = mul_polar(
-                    mul_polar(S[h, i, l], S[h, k, j]),
-                    add_polar((1, 0), (-S[h, l, k, 0], S[h, l, k, 1])),
-                )
-                term2 = mul_polar(mul_polar(S[h, i, l], S[h, k, k]), S[h, l, j])
-                term3 = mul_polar(
-                    mul_polar(S[h, i, k], S[h, l, j]),
-                    add_polar((1, 0), (-S[h, k, l, 0], S[h, k, l, 1])),
-                )
-                term4 = mul_polar(mul_polar(S[h, i, k], S[h, l, l]), S[h, k, j])
-                term5 = mul_polar(
-                    add_polar((1, 0), (-S[h, k, l, 0], S[h, k, l, 1])),
-                    add_polar((1, 0), (-S[h, l, k, 0], S[h, l, k, 1])),
-                )
-                term6 = mul_polar(S[h, k, k], S[h, l, l])
-                term7 = add_polar(add_polar(add_polar(term1, term2), term3), term4)
-                term8 = add_polar(term5, (-term6[0], term6[1]))
-                term9 = (term7[0] / term8[0], term7[1] - term8[1])
-                C[h, i, j] = add_polar(S[h, i, j], term9)
+    # split the matrix into magnitudes and phases, then slice out the
+    # connected rows and columns so every (h, i, j) entry is computed at once;
+    # S[h, i, k] and S[h, i, l] vary with i, S[h, k, j] and S[h, l, j] with j
+    R, P = S[..., 0], S[..., 1]
+    Sik = (R[:, :, k, None], P[:, :, k, None])
+    Sil = (R[:, :, l, None], P[:, :, l, None])
+    Skj = (R[:, None, k, :], P[:, None, k, :])
+    Slj = (R[:, None, l, :], P[:, None, l, :])
+
+    # the entries between the connected ports only vary with frequency
+    Skk = (R[:, k, k, None, None], P[:, k, k, None, None])
+    Sll = (R[:, l, l, None, None], P[:, l, l, None, None])
+    Skl = (R[:, k, l, None, None], P[:, k, l, None, None])
+    Slk = (R[:, l, k, None, None], P[:, l, k, None, None])
+
+    # (1 - S[h, k, l]) and (1 - S[h, l, k])
+    Akl = add_polar((1, 0), (-Skl[0], Skl[1]))
+    Alk = add_polar((1, 0), (-Slk[0], Slk[1]))
+
+    # calculate the resultant s-parameters for all ports and frequencies
+    term1 = mul_polar(mul_polar(Sil, Skj), Alk)
+    term2 = mul_polar(mul_polar(Sil, Skk), Slj)
+    term3 = mul_polar(mul_polar(Sik, Slj), Akl)
+    term4 = mul_polar(mul_polar(Sik, Sll), Skj)
+    term5 = mul_polar(Akl, Alk)
+    term6 = mul_polar(Skk, Sll)
+    term7 = add_polar(add_polar(add_polar(term1, term2), term3), term4)
+    term8 = add_polar(term5, (-term6[0], term6[1]))
+    term9 = (term7[0] / term8[0], term7[1] - term8[1])
+    C = np.stack(add_polar((R, P), term9), axis=-1)
 
     # remove ports that were `connected`
     C = np.delete(C, (k, l), 1)
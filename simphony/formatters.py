@@ -15,7 +15,7 @@ Specifically, instances of these classes should be used in the ``to_file`` and
 """
 
 import json
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -25,6 +25,33 @@ if TYPE_CHECKING:
     from simphony import Model
     from simphony.layout import Circuit
 
+# orjson is an optional dependency that is considerably faster than the
+# standard library for the large nested lists of scattering parameters
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data: Any, finite: bool = True) -> str:
+    """Serializes the data to JSON. orjson writes NaN and infinity as null,
+    so data with non-finite numbers always goes through the standard
+    library, which writes them as NaN and Infinity."""
+    if orjson is not None and finite:
+        return orjson.dumps(data).decode()
+    return json.dumps(data)
+
+
+def _loads(string: str) -> Any:
+    """Deserializes JSON, including the NaN and Infinity written by the
+    standard library, which orjson rejects."""
+    if orjson is not None:
+        try:
+            return orjson.loads(string)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(string)
+
 
 class ModelFormatter:
     """Base model formatter class that is extended to provide functionality for
@@ -34,7 +61,7 @@ class ModelFormatter:
 
     def _from_component(
         self, component: "Model", freqs: np.array
-    ) -> Tuple[str, List[str], Optional[np.ndarray], Optional[str]]:
+    ) -> Tuple[str, List[str], Optional[np.ndarray], Optional["Circuit"]]:
         """Gets the component's information that needs to be formatted.
 
         Parameters
@@ -51,9 +78,7 @@ class ModelFormatter:
         # we have been asked to flatten it
         if hasattr(component, "_wrapped_circuit") and not self.flatten_subcircuits:
             s_params = None
-            subcircuit = CircuitJSONFormatter().format(
-                component._wrapped_circuit, freqs
-            )
+            subcircuit = component._wrapped_circuit
         else:
             s_params = component.s_parameters(freqs)
             subcircuit = None
@@ -66,7 +91,7 @@ class ModelFormatter:
         name: str,
         pins: List[str],
         s_params: Optional[np.ndarray] = None,
-        subcircuit: Optional[str] = None,
+        subcircuit: Optional[Union[str, Dict[str, Any]]] = None,
     ) -> "Model":
         """Returns a component that is defined by the given parameters.
 
@@ -91,7 +116,12 @@ class ModelFormatter:
 
         if subcircuit is not None:
             # instantiate a subcircuit if there is subcircuit information
-            component = Subcircuit(CircuitJSONFormatter().parse(subcircuit))
+            # older files store the circuit as a nested JSON string
+            formatter = CircuitJSONFormatter()
+            if isinstance(subcircuit, str):
+                component = Subcircuit(formatter.parse(subcircuit))
+            else:
+                component = Subcircuit(formatter._from_dict(subcircuit))
         else:
             # instantiate a static model instance if s_params is given
             class StaticModel(Model):
@@ -101,10 +131,10 @@ class ModelFormatter:
                 def s_parameters(self, _freqs: np.array) -> np.ndarray:
                     try:
                         return interpolate(_freqs, freqs, s_params)
-                    except ValueError:
+                    except ValueError as e:
                         raise ValueError(
                             f"Frequencies must be between {freqs.min(), freqs.max()}."
-                        )
+                        ) from e
 
             component = StaticModel()
 
@@ -164,32 +194,84 @@ class JSONDecoder(json.JSONDecoder):
         return complex(dict["r"], dict["i"]) if "r" in dict else dict
 
 
+def _to_json_array(array: Optional[np.ndarray]) -> Optional[list]:
+    """Converts an array to nested lists of JSON-native types.
+
+    Complex values are stored as ``{"r": real, "i": imag}`` objects, the
+    same representation used by ``JSONEncoder``.
+    """
+    if array is None:
+        return None
+
+    array = np.asarray(array)
+    if not np.iscomplexobj(array):
+        return array.tolist()
+
+    # build the complex objects in one flat pass, then restore the nesting
+    pairs = np.stack((array.real, array.imag), axis=-1).reshape(-1, 2).tolist()
+    objects = np.empty(array.shape, dtype=object)
+    objects.reshape(-1)[:] = [{"r": r, "i": i} for r, i in pairs]
+    return objects.tolist()
+
+
+def _from_json_array(data: Optional[list]) -> Optional[np.ndarray]:
+    """Converts nested lists produced by ``_to_json_array`` back to an
+    array."""
+    if data is None:
+        return None
+
+    objects = np.array(data, dtype=object)
+    if objects.size and isinstance(objects.flat[0], dict):
+        values = [complex(value["r"], value["i"]) for value in objects.reshape(-1)]
+        return np.array(values, dtype=complex).reshape(objects.shape)
+
+    return objects.astype(float)
+
+
 class ModelJSONFormatter(ModelFormatter):
     """The ModelJSONFormatter class formats the model data in a JSON format."""
 
-    def format(self, component: "Model", freqs: np.array) -> str:
+    def _to_dict(
+        self, component: "Model", freqs: np.array
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Returns the component's data as a dictionary of JSON-native
+        types, and whether all of its numbers are finite."""
         name, pins, s_params, subcircuit = self._from_component(component, freqs)
-        return json.dumps(
-            {
-                "freqs": freqs,
-                "name": name,
-                "pins": pins,
-                "s_params": s_params,
-                "subcircuit": subcircuit,
-            },
-            cls=JSONEncoder,
-        )
-
-    def parse(self, string: str) -> "Model":
-        data = json.loads(string, cls=JSONDecoder)
+        finite = bool(np.isfinite(freqs).all())
+        if subcircuit is not None:
+            # embed the circuit's data directly, like the circuit formatter
+            # does for its components, rather than as a nested JSON string
+            subcircuit, subcircuit_finite = CircuitJSONFormatter()._to_dict(
+                subcircuit, freqs
+            )
+            finite = finite and subcircuit_finite
+        else:
+            finite = finite and bool(np.isfinite(s_params).all())
+        data = {
+            "freqs": np.asarray(freqs).tolist(),
+            "name": name,
+            "pins": pins,
+            "s_params": _to_json_array(s_params),
+            "subcircuit": subcircuit,
+        }
+        return data, finite
+
+    def _from_dict(self, data: Dict[str, Any]) -> "Model":
+        """Returns a component from a dictionary created by ``_to_dict``."""
         return self._to_component(
             np.array(data["freqs"]),
             data["name"],
             data["pins"],
-            np.array(data["s_params"]),
+            _from_json_array(data["s_params"]),
             data["subcircuit"],
         )
 
+    def format(self, component: "Model", freqs: np.array) -> str:
+        return _dumps(*self._to_dict(component, freqs))
+
+    def parse(self, string: str) -> "Model":
+        return self._from_dict(_loads(string))
+
 
 class CircuitFormatter:
     """Base circuit formatter class that is extended to provide functionality
@@ -219,10 +301,16 @@ class CircuitFormatter:
 class CircuitJSONFormatter:
     """This class handles converting a circuit to JSON and vice-versa."""
 
-    def format(self, circuit: "Circuit", freqs: np.array) -> str:
+    def _to_dict(
+        self, circuit: "Circuit", freqs: np.array
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Returns the circuit's data as a dictionary of JSON-native types,
+        and whether all of its numbers are finite."""
         from simphony.simulation import SimulationModel
         from simphony.simulators import Simulator
 
+        formatter = ModelJSONFormatter()
+        finite = True
         data = {"components": [], "connections": []}
         for i, component in enumerate(circuit):
             # skip simulators
@@ -230,12 +318,11 @@ class CircuitJSONFormatter:
                 component, SimulationModel
             ):
                 continue
-# PROBLEM- is data a dict... does this affect anything?
-# .append for dictionaries-- should be ok
-            # get a representation for each component
-            data["components"].append(
-                component.to_string(freqs, formatter=ModelJSONFormatter())
-            )
+            # embed each component's data directly rather than as a nested
+            # JSON string, so parsing decodes everything in a single pass
+            component_data, component_finite = formatter._to_dict(component, freqs)
+            data["components"].append(component_data)
+            finite = finite and component_finite
 
             # get all of the connections between components
             for j, pin in enumerate(component.pins):
@@ -252,17 +339,22 @@ class CircuitJSONFormatter:
                     except ValueError:
                         pass
 
-        return json.dumps(data)
+        return data, finite
 
-    def parse(self, string: str) -> "Circuit":
+    def _from_dict(self, data: Dict[str, Any]) -> "Circuit":
+        """Returns a circuit from a dictionary created by ``_to_dict``."""
         from simphony import Model
 
-        data = json.loads(string)
+        formatter = ModelJSONFormatter()
 
-        # load all of the components
+        # load all of the components, older files store each one as a
+        # nested JSON string instead of an object
         components = []
-        for string in data["components"]:
-            components.append(Model.from_string(string, formatter=ModelJSONFormatter()))
+        for component in data["components"]:
+            if isinstance(component, str):
+                components.append(Model.from_string(component, formatter=formatter))
+            else:
+                components.append(formatter._from_dict(component))
 
         # connect the components to each other
         for i, j, k, l in data["connections"]:
@@ -270,6 +362,12 @@ class CircuitJSONFormatter:
 
         return components[0].circuit
 
+    def format(self, circuit: "Circuit", freqs: np.array) -> str:
+        return _dumps(*self._to_dict(circuit, freqs))
+
+    def parse(self, string: str) -> "Circuit":
+        return self._from_dict(_loads(string))
+
 
 class CircuitSiEPICFormatter(CircuitFormatter):
     """This class saves/loads circuits in the SiEPIC SPICE format."""
@@ -336,11 +434,28 @@ class CircuitSiEPICFormatter(CircuitFormatter):
                 components.append(component)
 
             # connect the netlists
-            # compare indices so we only connect components once
-            for i, comp1 in enumerate(components):
-                for j, comp2 in enumerate(components):
-                    if comp1 != comp2 and i <= j:
-                        comp1.interface(comp2)
+            # group the renamed pins by net in a single pass so that each pin
+            # only looks at the pins sharing its net (the same rule as
+            # Model.interface) instead of every pin of every other component
+            indices = {id(component): i for i, component in enumerate(components)}
+            nets = {}
+            for component in components:
+                for pin in component.pins:
+                    if pin.name[0:3] != "pin":
+                        nets.setdefault(pin.name, []).append(pin)
+
+            # compare indices so we only connect components once, and connect
+            # in the same order as interfacing every pair of components would
+            for i, component in enumerate(components):
+                pairs = []
+                for k, pin in enumerate(component.pins):
+                    for other in nets.get(pin.name, ()):
+                        j = indices[id(other._component)]
+                        if j > i:
+                            pairs.append((j, k, pin, other))
+
+                for _, _, pin, other in sorted(pairs, key=lambda pair: pair[:2]):
+                    pin.connect(other)
 
             # create a subcircuit instance
             # not permanent because we end up returning the wrapped circuit
@@ -12,7 +12,7 @@ other, they will make sure that they belong to the same ``Circuit`` instance.
 """
 
 import os
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Iterable, List, Optional
 
 from simphony.formatters import CircuitFormatter, CircuitJSONFormatter
 
@@ -31,6 +31,20 @@ class Circuit(list):
     they are connected and disconnected from one another.
     """
 
+    def __contains__(self, component: "Model") -> bool:
+        """Returns whether the component belongs to the circuit in constant
+        time."""
+        return component in self._members
+
+    def __copy__(self) -> "Circuit":
+        """Returns a shallow copy of the circuit with its own set of
+        members."""
+        copy = self.__class__.__new__(self.__class__)
+        copy.__dict__.update(self.__dict__)
+        copy._members = set()
+        copy.extend(self)
+        return copy
+
     def __hash__(self) -> int:
         """Gets a hash for the circuit based on components and connections."""
         from simphony.simulators import Simulator
@@ -56,6 +70,10 @@ class Circuit(list):
         """
         super().__init__([component])
 
+        # the components are also tracked in a set (models hash by identity)
+        # so that membership checks don't need to scan the whole circuit
+        self._members = {component}
+
     def __str__(self) -> str:
         return self._str_recursive(components=self._get_components()).rstrip()
 
@@ -131,6 +149,19 @@ class Circuit(list):
 
         return output
 
+    def append(self, component: "Model") -> None:
+        """Appends the component to the circuit, keeping the member set used
+        by ``__contains__`` in sync."""
+        super().append(component)
+
+        # unpickling appends the components before restoring the attributes
+        self.__dict__.setdefault("_members", set()).add(component)
+
+    def extend(self, components: Iterable["Model"]) -> None:
+        """Appends every component to the circuit."""
+        for component in components:
+            self.append(component)
+
     @property
     def pins(self) -> List["Pin"]:
         """Returns the pins for the circuit."""
@@ -12,6 +12,9 @@ rest of the SiEPIC library.
 
 # See here: https://github.com/erikrose/parsimonious
 
+import os
+from functools import lru_cache
+
 import numpy as np
 from parsimonious.grammar import Grammar
 from parsimonious.nodes import NodeVisitor
@@ -20,10 +23,10 @@ sparam_grammar = Grammar(
     r"""
     file        = preamble* paramset* ws*
     preamble    = lbrack quoted comma ws* quoted rbrack ws*
-    paramset    = header shape datapoint* ws*
+    paramset    = header shape datapoints ws*
     header      = lpar port comma mode comma number comma port comma number comma type rpar ws*
     shape       = lpar number comma ws* number rpar ws*
-    datapoint   = number ws+ number ws+ number ws*
+    datapoints  = ~r"(?:\s*[-+]?[0-9]+[.]?[0-9]*(?:[eE][-+]?[0-9]+)?)*"
 
     port        = quote "port" ws number quote
     mode        = quote? string quote?
@@ -62,7 +65,7 @@ class ParamVisitor(NodeVisitor):
     def visit_paramset(self, node, visited_children):
         """
         Handles the grammar:
-            paramset    = header shape datapoint* ws*
+            paramset    = header shape datapoints ws*
 
         Example:
             ('port 1','TE',1,'port 1',1,"transmission")
@@ -73,12 +76,7 @@ class ParamVisitor(NodeVisitor):
         Returns:
             dict : an initialized dictionary object.
         """
-        header, shape, datapoints, _ = visited_children
-        f = []
-        s = []
-        for child in datapoints:
-            f.append(child[0])
-            s.append(child[1])
+        header, shape, (f, s), _ = visited_children
         header["f"] = f
         header["s"] = s
         return header
@@ -117,20 +115,28 @@ class ParamVisitor(NodeVisitor):
             input_port=input_port, output_port=output_port, mode=mode, type_=type_
         )
 
-    def visit_datapoint(self, node, visited_children):
+    def visit_datapoints(self, node, visited_children):
         """
         Handles the grammar:
-            datapoint   = number ws+ number ws+ number ws*
+            datapoints  = ~r"(?:\s*[-+]?[0-9]+[.]?[0-9]*(?:[eE][-+]?[0-9]+)?)*"
+
+        The whole block of datapoints is matched by a single regular
+        expression and converted in one pass, rather than visiting a node
+        for every number.
 
         Example:
             1.8737028625000000e+14 8.8032014721294136e-04 -4.9073858469422826e-01
+            1.8762028625000000e+14 8.8032014721294136e-04 -4.9073858469422826e-01
 
         Returns:
-            (float, np.complex128) : tuple of frequency value and complex transmission
+            (np.ndarray, np.ndarray) : arrays of frequency values and complex
+            transmissions
         """
-        freq, _, real, _, imag, *_ = node.children
-        freq, real, imag = float(freq.text), float(real.text), float(imag.text)
-        return (freq, real * np.exp(1j * imag))
+        try:
+            values = np.array(node.text.split(), dtype=float).reshape(-1, 3)
+        except ValueError as e:
+            raise ValueError("Each datapoint must have exactly three values.") from e
+        return values[:, 0], values[:, 1] * np.exp(1j * values[:, 2])
 
     def visit_port(self, node, visited_children):
         """
@@ -193,6 +199,10 @@ class ParamVisitor(NodeVisitor):
         return visited_children or node
 
 
+# The visitor keeps no state between parses, so a single instance is shared.
+_param_visitor = ParamVisitor()
+
+
 def read_params(filename):
     """
     Parameters
@@ -206,11 +216,20 @@ def read_params(filename):
         Returns a list of dictionaries as constructed by ParamVisitor.
         Dictionary contains frequency array, s-parameters, and other
         information on a port-by-port basis.
+
+    Notes
+    -----
+    Parsed files are cached by filename and modification time, so the
+    returned dictionaries are shared between calls and must not be modified.
     """
+    return _read_params(filename, os.path.getmtime(filename))
+
+
+@lru_cache(maxsize=32)
+def _read_params(filename, mtime):
     with open(filename, "r") as f:
         tree = sparam_grammar.parse(f.read())
-    pv = ParamVisitor()
-    return pv.visit(tree)
+    return _param_visitor.visit(tree)
 
 
 def build_matrix(dicts):
@@ -231,7 +250,8 @@ def build_matrix(dicts):
         second value is a 3-dimensional matrix with the s-parameters for port-
         to-port interactions indexed by frequency.
     """
-    f = dicts[0]["f"]
+    # copy the frequencies so the cached dictionaries can't be modified
+    f = dicts[0]["f"].copy()
     shape = int(np.sqrt(len(dicts)))
     s = np.zeros((len(f), shape, shape), dtype="complex128")
     for d in dicts:
@@ -114,11 +114,11 @@ class Model:
             except AttributeError:
                 try:
                     self.pins = PinList(self, self.__class__.pin_count)
-                except AttributeError:
+                except AttributeError as e:
                     name = self.__class__.__name__
                     raise NotImplementedError(
                         f"{name}.pin_count or {name}.pins needs to be defined."
-                    )
+                    ) from e
 
     def __str__(self) -> str:
         name = self.name or f"{self.__class__.__name__} component"
@@ -548,10 +548,9 @@ class Subcircuit(Model):
         from simphony.simulators import Simulator
 
         all_pins = []
-        available_pins = []
-        s_block = None
+        blocks = []
 
-        # merge all of the s_params into one giant block diagonal matrix
+        # get the s_params of every component in the circuit
         for component in self._wrapped_circuit:
             # simulators don't have scattering parameters
             if isinstance(component, Simulator) or isinstance(
@@ -563,64 +562,56 @@ class Subcircuit(Model):
             if s_parameters_method == "s_parameters":
                 # each frequency has a different s-matrix, so we need to cache
                 # the s-matrices by frequency as well as component
-                s_params = []
-                for freq in freqs:
-                    try:
-                        # use the cached s-matrix if available
-                        s_matrix = self.__class__.scache[component][freq]
-                    except KeyError:
-                        # make sure the frequency dict is created
-                        if component not in self.__class__.scache:
-                            self.__class__.scache[component] = {}
-
-                        # store the s-matrix for the frequency and component
-                        s_matrix = getattr(component, s_parameters_method)(
-                            np.array([freq])
-                        )[0]
-                        self.__class__.scache[component][freq] = s_matrix
-
-                    # add the s-matrix to our list of s-matrices
-                    s_params.append(s_matrix)
-
-                # convert to numpy array for the rest of the function
-                s_params = np.array(s_params)
+                cache = self.__class__.scache.setdefault(component, {})
+
+                # calculate every uncached frequency in a single call
+                missing = list(dict.fromkeys(f for f in freqs if f not in cache))
+                if missing:
+                    computed = getattr(component, s_parameters_method)(
+                        np.array(missing)
+                    )
+                    cache.update(zip(missing, computed))
+
+                # stack the cached s-matrices into one contiguous array
+                s_params = np.array([cache[freq] for freq in freqs])
             elif s_parameters_method == "monte_carlo_s_parameters":
                 # don't cache Monte Carlo scattering parameters
                 s_params = getattr(component, s_parameters_method)(freqs)
 
-            # merge the s_params into the block diagonal matrix
-            if s_block is None:
-                if s_params.ndim == 3:
-                    s_block = np.stack((np.abs(s_params), np.angle(s_params)), axis=-1)
-                else:
-                    s_block = s_params
-            else:
-                s_block = create_block_diagonal(s_block, s_params)
+            # collect the s_params for the block diagonal matrix
+            blocks.append(s_params)
 
             # keep track of all of the pins (in order) in the circuit
             all_pins += component.pins
-            available_pins += component.pins
+
+        # merge all of the s_params into the block diagonal matrix at once
+        s_block = create_block_diagonal(*blocks) if blocks else None
+
+        # map every pin to its row/column in the block diagonal matrix once,
+        # and flag the rows/columns that have already been connected
+        indices = {pin: i for i, pin in enumerate(all_pins)}
+        connected = np.zeros(len(all_pins), dtype=bool)
 
         # use the subnetwork growth algorithm for each connection
         for pin in all_pins:
             # make sure pins only get connected once
             # and pins connected to simulators get skipped
-            if (
-                pin._isconnected(include_simulators=False)
-                and pin in available_pins
-                and pin._connection in available_pins
-            ):
-                # the pin indices in available_pins lines up with the row/column
-                # indices in the matrix. as the matrix shrinks, we remove pins
-                # from available_pins so the indices always line up
-                k = available_pins.index(pin)
-                l = available_pins.index(pin._connection)
+            if not pin._isconnected(include_simulators=False):
+                continue
+            i = indices[pin]
+            j = indices.get(pin._connection)
+            if j is None or connected[i] or connected[j]:
+                continue
+
+            # the matrix shrinks with every connection, so a pin's row/column
+            # moves up by the number of connected pins that came before it
+            k = i - np.count_nonzero(connected[:i])
+            l = j - np.count_nonzero(connected[:j])
 # PROBLEM- changing s_block, may have to create another one
 # which is problematic because this is what we are returning
-                s_block = innerconnect_s(s_block, k, l)
+            s_block = innerconnect_s(s_block, k, l)
 
-                available_pins.remove(pin)
-                available_pins.remove(pin._connection)
+            connected[i] = connected[j] = True
 
         return s_block
 
@@ -143,5 +143,5 @@ class PinList(list):
         try:
             for index, name in enumerate(names):
                 self.__getitem__(index).rename(name)
-        except IndexError:
-            raise ValueError(f"Pin {index + 1} does not exist.")
+        except IndexError as e:
+            raise ValueError(f"Pin {index + 1} does not exist.") from e
@@ -2,9 +2,15 @@
 # Licensed under the terms of the MIT License
 # (see simphony/__init__.py for details)
 
+import io
 import os
+import re
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
-from typing import Any, Dict
+from functools import partial
+from typing import Any, Dict, Optional
 
 from parsimonious.grammar import Grammar
 from parsimonious.nodes import NodeVisitor
@@ -15,15 +21,10 @@ from simphony.tools import str2float
 # The "dynamic list" isn't it's own class, but a regular
 # list that uses these functions to perform operations.
 def _dlist_insert(dlist, index, element):
-    try:
-        dlist[index] = element
-        return dlist
-    except IndexError:
-        new = [None] * (index + 1)
-        for i, v in enumerate(dlist):
-            new[i] = v
-        new[index] = element
-        return new
+    if index >= len(dlist):
+        dlist.extend([None] * (index + 1 - len(dlist)))
+    dlist[index] = element
+    return dlist
 
 
 # Typically instantiations of some kind
@@ -39,6 +40,31 @@ class Directives(Enum):
     SUBCKT = 3
 
 
+def _new_contents():
+    """Returns an empty container for the contents of a spice file."""
+    return {
+        "circuits": [],
+        "subcircuits": [],
+        "analyses": [],
+    }
+
+
+def _sort_items(container, typ, payload):
+    """Files a parsed item into the appropriate list of the container."""
+    if type(typ) == Directives:
+        if typ == Directives.SUBCKT:
+            container["subcircuits"].append(payload)
+        elif typ == Directives.ONA:
+            container["analyses"].append(payload)
+        elif typ == Directives.INCLUDE:
+            container["circuits"] += payload["circuits"]
+            container["subcircuits"] += payload["subcircuits"]
+            container["analyses"] += payload["analyses"]
+    elif type(typ) == SpiceObjects:
+        if typ == SpiceObjects.CIRCUIT:
+            container["circuits"].append(payload)
+
+
 # ==============================================================================
 # Grammar and NodeVisitor for *main.spi files generated by SiEPIC-Tools (KLayout)
 # ==============================================================================
@@ -104,33 +130,11 @@ class SpiceVisitor(NodeVisitor):
             Dictionary of all items within the spice file with the following keys:
             [`circuits`, `subcircuits`, `analyses`].
         """
-        contents = {
-            "circuits": [],
-            "subcircuits": [],
-            "analyses": [],
-        }
-
-        def sort_items(container, typ, payload):
-            if type(typ) == Directives:
-                if typ == Directives.SUBCKT:
-                    container["subcircuits"].append(payload)
-                elif typ == Directives.ONA:
-                    container["analyses"].append(payload)
-                elif typ == Directives.INCLUDE:
-                    # container['circuits'].update(payload['circuits'])
-                    container["circuits"] += payload["circuits"]
-                    container["subcircuits"] += payload["subcircuits"]
-                    # for a in payload['analyses']:
-                    #     container['analyses'].append(a)
-                    container["analyses"] += payload["analyses"]
-            elif type(typ) == SpiceObjects:
-                if typ == SpiceObjects.CIRCUIT:
-                    container["circuits"].append(payload)
-
+        contents = _new_contents()
         items = [item[0] for item in visited_children if item[0] is not None]
         for item in items:
             typ, payload = item
-            sort_items(contents, typ, payload)
+            _sort_items(contents, typ, payload)
         return contents
 
     def visit_directive(self, node, visited_children):
@@ -190,7 +194,9 @@ class SpiceVisitor(NodeVisitor):
     def visit_include(self, node, visited_children):
         # include     = ".INCLUDE" ws+ quoted newline
         _, _, quoted, _ = visited_children
-        return Directives.INCLUDE, load_spi_from_file(quoted)
+        return Directives.INCLUDE, load_spi_from_file(
+            quoted, use_legacy=True, base_dir=getattr(_spi_local, "base_dir", None)
+        )
 
     def visit_subckt(self, node, visited_children):
         """
@@ -220,8 +226,9 @@ class SpiceVisitor(NodeVisitor):
 
     def visit_header(self, node, visited_children):
         # header      = word ws+ (word ws*)* newline
-        name, _, externals, _ = visited_children
-        externals = [ext[0] for ext in externals]
+        # words never contain whitespace, so split the text instead of
+        # unpacking the nested children
+        name, *externals = node.text.split()
         return {"name": name, "externals": externals}
 
     def visit_param(self, node, visited_children):
@@ -246,10 +253,7 @@ class SpiceVisitor(NodeVisitor):
 
     def visit_ports(self, node, visited_children):
         # ports       = ((external / internal) ws?)+
-        ports = []
-        for port in visited_children:
-            ports.append(port[0][0])
-        return ports
+        return _PORT_RE.findall(node.text)
 
     def visit_external(self, node, visited_children):
         # external    = ~r"([-\w]+(detector|laser)[\d]?)"
@@ -367,7 +371,212 @@ class SpiceVisitor(NodeVisitor):
         return visited_children or node
 
 
-def load_spi_from_file(path: str) -> Dict[str, Any]:
+# The visitor keeps no state between parses, so a single instance is shared.
+# The directory that .INCLUDE directives are relative to is kept per thread.
+_spi_visitor = SpiceVisitor()
+_spi_local = threading.local()
+
+
+# ==============================================================================
+# Line-oriented tokenizer for *main.spi files generated by SiEPIC-Tools (KLayout)
+# ==============================================================================
+#
+# The files written by SiEPIC-Tools put exactly one statement on each line
+# (with `.ona` options continued on lines starting with "+"), so they can be
+# parsed in a single pass with a handful of precompiled regular expressions
+# instead of building and walking a full parse tree. The patterns mirror the
+# rules of `spi_grammar` above, which is kept for the legacy parser.
+
+_WORD = r"[-\w,$<>]+"
+_NUMBER_RE = re.compile(r"[-+]?[0-9]+[.]?[0-9]*(?:[eE][-+]?[0-9]+|[a-zA-Z])?")
+_PAIR_RE = re.compile(
+    r"(" + _WORD + r")(?:\(([^)\s]+)\))?[ \t]*=[ \t]*(\"[^\"]+\"|[^\s\"]+)"
+)
+_PORT_RE = re.compile(r"<defunct>\S+|[-\w$]+(?:detector|laser)\d?|N\$[-\d]+")
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+_TOKEN_RE = re.compile(r"\S+")
+_WORD_RE = re.compile(_WORD)
+
+
+def _syntax_error(lineno, line):
+    return ValueError(f"Invalid spice syntax on line {lineno}: '{line.strip()}'")
+
+
+def _parse_value(value, lineno, line):
+    # value       = quoted / number / word
+    if value[0] == '"':
+        return value[1:-1]
+    if _NUMBER_RE.fullmatch(value):
+        return str2float(value)
+
+    # like the grammar, reject words that start like a number (e.g. '1.5um')
+    # rather than silently keeping them as strings
+    if _NUMBER_RE.match(value) or not _WORD_RE.fullmatch(value):
+        raise _syntax_error(lineno, line)
+    return value
+
+
+def _parse_pairs(text, lineno, line):
+    """Parses a run of `key=value` pairs into a list of dictionaries with the
+    keys [`name`, `value`] (and `order`, for keys of the form `key(n)`)."""
+    pairs = []
+    pos = 0
+    for match in _PAIR_RE.finditer(text):
+        if text[pos : match.start()].strip():
+            raise _syntax_error(lineno, line)
+        name, order, value = match.groups()
+        if order is None:
+            pairs.append({"name": name, "value": _parse_value(value, lineno, line)})
+        else:
+            pairs.append(
+                {
+                    "name": name,
+                    "order": int(str2float(order)),
+                    "value": _parse_value(value, lineno, line),
+                }
+            )
+        pos = match.end()
+    if text[pos:].strip():
+        raise _syntax_error(lineno, line)
+    return pairs
+
+
+def _parse_instance(line, lineno, component):
+    """Parses a component line within a subcircuit or a top-level circuit
+    line.
+
+    Returns the name, the ports, the model (or subcircuit) name, and the
+    remainder of the line, which holds the parameters.
+    """
+    tokens = _TOKEN_RE.finditer(line)
+    try:
+        name = next(tokens).group()
+        token = next(tokens)
+        if component:
+            if token.group().startswith("<defunct>") and _WORD_RE.fullmatch(
+                token.group()[9:]
+            ):
+                token = next(tokens)
+            if token.group() == "None":
+                token = next(tokens)
+        # net names repeat across components, so intern them to share a
+        # single string per net
+        ports = []
+        while _PORT_RE.fullmatch(token.group()):
+            ports.append(sys.intern(token.group()))
+            token = next(tokens)
+    except StopIteration:
+        raise _syntax_error(lineno, line)
+
+    if not ports or not _WORD_RE.fullmatch(token.group()):
+        raise _syntax_error(lineno, line)
+    return name, ports, token.group(), line[token.end() :]
+
+
+def _add_ona_options(ona, options):
+    for option in options:
+        if "order" in option:
+            # Text file uses 1-based indexing, so express as
+            # option['order'] - 1
+            ona["params"][option["name"]] = _dlist_insert(
+                ona["params"].get(option["name"], []),
+                option["order"] - 1,
+                option["value"],
+            )
+        else:
+            ona["params"][option["name"]] = option["value"]
+
+
+def _iter_spi(lines, base_dir=None):
+    """Generates `(typ, payload)` tuples for every statement in the lines of
+    a spice file, where `typ` is a `Directives` or `SpiceObjects` member.
+    `lines` can be any iterable of lines, such as an open file, so the file
+    is never read into memory all at once.
+
+    The payloads are identical to those produced by `SpiceVisitor`, except
+    that `.INCLUDE` directives yield the path of the file to include,
+    resolved relative to `base_dir`, so they can be parsed separately.
+    """
+    ona = None
+    subckt = None
+    for lineno, line in enumerate(lines, 1):
+        stripped = line.strip()
+        if not stripped or stripped[0] == "*":
+            continue
+
+        # options continue the most recent .ona directive
+        if stripped[0] == "+":
+            if ona is None:
+                raise _syntax_error(lineno, line)
+            _add_ona_options(ona, _parse_pairs(stripped[1:], lineno, line))
+            continue
+        ona = None
+
+        if stripped[0] == ".":
+            keyword, *rest = stripped.split(None, 1)
+            rest = rest[0] if rest else ""
+            if subckt is not None:
+                if keyword == ".param":
+                    pairs = _parse_pairs(rest, lineno, line)
+                    if len(pairs) != 1:
+                        raise _syntax_error(lineno, line)
+                    subckt["params"][pairs[0]["name"]] = pairs[0]["value"]
+                elif keyword == ".ends":
+                    if rest.strip() != subckt["name"]:
+                        raise ValueError(
+                            "Invalid netlist (name in header and footer does not match)."
+                        )
+                    yield Directives.SUBCKT, subckt
+                    subckt = None
+                else:
+                    raise _syntax_error(lineno, line)
+            elif keyword == ".ona":
+                ona = {"definition": {}, "params": {}}
+                for param in _parse_pairs(rest, lineno, line):
+                    ona["definition"][param["name"]] = param["value"]
+                yield Directives.ONA, ona
+            elif keyword == ".INCLUDE":
+                match = _QUOTED_RE.fullmatch(rest.strip())
+                if match is None:
+                    raise _syntax_error(lineno, line)
+                yield Directives.INCLUDE, os.path.join(base_dir or "", match.group(1))
+            elif keyword == ".subckt":
+                header = rest.split()
+                if not header:
+                    raise _syntax_error(lineno, line)
+                subckt = {
+                    "name": header[0],
+                    "ports": [sys.intern(port) for port in header[1:]],
+                    "components": [],
+                    "params": {},
+                }
+            else:
+                raise _syntax_error(lineno, line)
+        elif subckt is not None:
+            name, ports, model, rest = _parse_instance(line, lineno, True)
+            params = {p["name"]: p["value"] for p in _parse_pairs(rest, lineno, line)}
+            subckt["components"].append(
+                {"name": name, "model": model, "ports": ports, "params": params}
+            )
+        else:
+            name, ports, subcircuits, rest = _parse_instance(line, lineno, False)
+            yield SpiceObjects.CIRCUIT, {
+                "name": name,
+                "ports": ports,
+                "subcircuits": subcircuits,
+                "params": _parse_pairs(rest, lineno, line),
+            }
+
+    if subckt is not None:
+        raise ValueError(f"Invalid netlist (subcircuit '{subckt['name']}' never ends).")
+
+
+def load_spi_from_file(
+    path: str,
+    use_legacy: bool = False,
+    base_dir: Optional[str] = None,
+    parallel: bool = False,
+) -> Dict[str, Any]:
     """Parses a spice file and returns the data as a dictionary in a form
     accepted by `build_circuit()`.
 
@@ -375,21 +584,40 @@ def load_spi_from_file(path: str) -> Dict[str, Any]:
     ----------
     path : str
         Path to the spice file to be parsed.
+    use_legacy : bool, optional
+        Parse the file using the parsimonious grammar instead of the
+        line-oriented tokenizer (default False).
+    base_dir : str, optional
+        Directory that `path` is relative to (default is the current working
+        directory). `.INCLUDE` directives are resolved relative to the
+        directory of the file that contains them.
+    parallel : bool, optional
+        Parse the files included by this file in separate processes
+        (default False). Only worth it for several large includes; scripts
+        using it need an ``if __name__ == "__main__"`` guard on platforms
+        that spawn new processes.
+
+    Raises
+    ------
+    ValueError
+        when a file (directly or indirectly) includes itself.
     """
-    cwd = os.getcwd()
-    path, filename = os.path.split(path)
-    if path != "":
-        os.chdir(path)
-
-    with open(filename, "r") as f:
-        res = load_spi_from_string(f.read())
-        f.close()
+    path = os.path.join(base_dir or "", path)
+    if use_legacy:
+        with open(path, "r") as f:
+            return load_spi_from_string(
+                f.read(), use_legacy=True, base_dir=os.path.dirname(path)
+            )
 
-    os.chdir(cwd)
-    return res
+    return _load_spi_file(path, parallel=parallel)
 
 
-def load_spi_from_string(string: str) -> Dict[str, Any]:
+def load_spi_from_string(
+    string: str,
+    use_legacy: bool = False,
+    base_dir: Optional[str] = None,
+    parallel: bool = False,
+) -> Dict[str, Any]:
     """Parses a spice string and returns the data as a dictionary in a form
     accepted by `build_circuit()`.
 
@@ -397,5 +625,61 @@ def load_spi_from_string(string: str) -> Dict[str, Any]:
     ----------
     string :
         The string to be parsed.
+    use_legacy : bool, optional
+        Parse the string using the parsimonious grammar instead of the
+        line-oriented tokenizer (default False).
+    base_dir : str, optional
+        Directory that `.INCLUDE` directives are relative to (default is the
+        current working directory).
+    parallel : bool, optional
+        Parse included files in separate processes (default False), see
+        `load_spi_from_file()`.
     """
-    return SpiceVisitor().visit(spi_grammar.parse(string))
+    if use_legacy:
+        # restore the including file's directory once an include is parsed
+        previous = getattr(_spi_local, "base_dir", None)
+        _spi_local.base_dir = base_dir
+        try:
+            return _spi_visitor.visit(spi_grammar.parse(string))
+        finally:
+            _spi_local.base_dir = previous
+
+    # iterate the lines lazily rather than splitting the whole string up front
+    lines = io.StringIO(string, newline=None)
+    return _load_spi_lines(lines, base_dir, parallel=parallel)
+
+
+def _load_spi_file(path, parents=frozenset(), parallel=False):
+    """Parses a spice file, where `parents` holds the real paths of the
+    files that (indirectly) include it."""
+    real_path = os.path.realpath(path)
+    if real_path in parents:
+        raise ValueError(f"Circular .INCLUDE of '{path}'.")
+
+    # stream the lines from disk instead of reading the whole file
+    with open(path, "r") as f:
+        return _load_spi_lines(
+            f, os.path.dirname(path), parents | {real_path}, parallel
+        )
+
+
+def _load_spi_lines(lines, base_dir, parents=frozenset(), parallel=False):
+    items = list(_iter_spi(lines, base_dir))
+
+    # included files don't depend on each other, so they can be parsed in
+    # separate processes; the workers themselves always parse serially
+    includes = [payload for typ, payload in items if typ == Directives.INCLUDE]
+    load = partial(_load_spi_file, parents=parents)
+    if parallel and len(includes) > 1:
+        with ProcessPoolExecutor() as executor:
+            included = iter(list(executor.map(load, includes)))
+    else:
+        included = map(load, includes)
+
+    # merge everything in the order it appears in the file
+    contents = _new_contents()
+    for typ, payload in items:
+        if typ == Directives.INCLUDE:
+            payload = next(included)
+        _sort_items(contents, typ, payload)
+    return contents
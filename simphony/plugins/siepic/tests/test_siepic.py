@@ -3,8 +3,16 @@
 # (see simphony/__init__.py for details)
 
 import os
+import threading
 
-from simphony.plugins.siepic import load_spi_from_file
+import pytest
+
+from simphony.plugins.siepic import (
+    SpiceVisitor,
+    load_spi_from_file,
+    load_spi_from_string,
+    spi_grammar,
+)
 
 # ==============================================================================
 # Test the parser
@@ -562,6 +570,83 @@ def test_top():
     assert res == top_result
 
 
+def test_base_dir():
+    base_dir = os.path.join(os.path.dirname(__file__), "spice", "MZI4")
+    res = load_spi_from_file("MZI4_main.spi", base_dir=base_dir)
+    assert res == MZI4_result
+
+
+def test_legacy_parser():
+    filename = os.path.join(os.path.dirname(__file__), "spice", "top", "top_main.spi")
+    res = load_spi_from_file(filename, use_legacy=True)
+    assert res == top_result
+
+
+def test_visitor_on_new_thread(monkeypatch):
+    # the visitor can be used directly, without going through the loaders
+    directory = os.path.join(os.path.dirname(__file__), "spice", "top")
+    monkeypatch.chdir(directory)
+    with open("top_main.spi") as f:
+        tree = spi_grammar.parse(f.read())
+
+    results = []
+    thread = threading.Thread(target=lambda: results.append(SpiceVisitor().visit(tree)))
+    thread.start()
+    thread.join()
+    assert results == [top_result]
+
+
+def test_interned_nets():
+    base_dir = os.path.join(os.path.dirname(__file__), "spice", "MZI4")
+    res = load_spi_from_file("MZI4_main.spi", base_dir=base_dir)
+    nets = {}
+    for component in res["subcircuits"][0]["components"]:
+        for port in component["ports"]:
+            assert nets.setdefault(port, port) is port
+
+
+def test_multiple_includes(tmp_path):
+    spice = os.path.join(os.path.dirname(__file__), "spice")
+    for name in ("MZI4", "top"):
+        with open(os.path.join(spice, name, name + ".spi")) as f:
+            (tmp_path / (name + ".spi")).write_text(f.read())
+    (tmp_path / "main.spi").write_text('.INCLUDE "MZI4.spi"\n.INCLUDE "top.spi"\n')
+
+    res = load_spi_from_file(str(tmp_path / "main.spi"))
+    assert res == load_spi_from_file(str(tmp_path / "main.spi"), use_legacy=True)
+    assert res == load_spi_from_file(str(tmp_path / "main.spi"), parallel=True)
+    assert [subckt["name"] for subckt in res["subcircuits"]] == ["MZI4", "top"]
+
+
+def test_circular_include(tmp_path):
+    (tmp_path / "a.spi").write_text('.INCLUDE "b.spi"\n.INCLUDE "b.spi"\n')
+    (tmp_path / "b.spi").write_text('.INCLUDE "a.spi"\n')
+
+    with pytest.raises(ValueError):
+        load_spi_from_file(str(tmp_path / "a.spi"))
+    with pytest.raises(ValueError):
+        load_spi_from_file(str(tmp_path / "a.spi"), parallel=True)
+
+
+COMPONENT = "wg N$0 N$1 ebeam_wg_integral_1550 lay_x={}\n"
+
+
+@pytest.mark.parametrize(
+    "spice, message",
+    [
+        ("+ lay_x=0\n", "Invalid spice syntax on line 1"),
+        (".subckt a N$0\n" + COMPONENT.format(0) + ".ends b\n", "does not match"),
+        (".subckt a N$0\n" + COMPONENT.format(0), "never ends"),
+        (".subckt a N$0\n" + COMPONENT.format("1.5o") + ".ends a\n", "Suffix 'o'"),
+        (".subckt a N$0\n" + COMPONENT.format("1.5um") + ".ends a\n", "line 2"),
+        (".INCLUDE top.spi\n", "Invalid spice syntax on line 1"),
+    ],
+)
+def test_invalid_spice(spice, message):
+    with pytest.raises(ValueError, match=message):
+        load_spi_from_string(spice)
+
+
 # ==============================================================================
 # Test the builder
 # ==============================================================================
@@ -92,15 +92,16 @@ class Simulator(Model):
             if s_parameters_method == "s_parameters":
                 self.__class__.scache[self.circuit] = s_params
 
-        # convert the scattering parameters to power ratios
-        power_ratios = np.abs(s_params.copy()) ** 2
-        if dB:
-            power_ratios = np.log10(power_ratios)
-
         input = self.circuit.pins.index(self.pins["to_input"]._connection)
         output = self.circuit.pins.index(self.pins["to_output"]._connection)
 
-        return (freqs, power_ratios[:, input, output, 0])
+        # convert the scattering parameters we need to power ratios,
+        # np.abs returns a new array so the cached s_params are left untouched
+        power_ratios = np.abs(s_params[:, input, output, 0]) ** 2
+        if dB:
+            power_ratios = np.log10(power_ratios)
+
+        return (freqs, power_ratios)
 
     @classmethod
     def clear_scache(cls) -> None:
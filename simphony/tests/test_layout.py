@@ -2,6 +2,9 @@
 # Licensed under the terms of the MIT License
 # (see simphony/__init__.py for details)
 
+import copy
+import pickle
+
 import numpy as np
 import pytest
 
@@ -448,3 +451,24 @@ class TestCircuit:
             mzi_monte_carlo_s_parameters,
             mzi.to_subcircuit(permanent=False).monte_carlo_s_parameters(freqs),
         )
+
+    def test_deepcopy_membership(self, mzi):
+        mzi2 = copy.deepcopy(mzi)
+        assert all(component in mzi2 for component in mzi2)
+        assert not any(component in mzi2 for component in mzi)
+
+    def test_pickle_membership(self, mzi):
+        mzi2 = pickle.loads(pickle.dumps(mzi))
+        assert all(component in mzi2 for component in mzi2)
+
+    def test_copy_membership(self, mzi):
+        mzi2 = copy.copy(mzi)
+        component = siepic.Waveguide(length=10e-6)
+        mzi2._add(component)
+        assert component in mzi2
+        assert component not in mzi
+
+    def test_append_membership(self, mzi):
+        component = siepic.Waveguide(length=10e-6)
+        mzi.append(component)
+        assert component in mzi
@@ -2,6 +2,7 @@
 # Licensed under the terms of the MIT License
 # (see simphony/__init__.py for details)
 
+import numpy as np
 import pytest
 
 from simphony.libraries import siepic
@@ -122,3 +123,18 @@ class TestSubcircuitExtension:
 
         assert [pin.name for pin in brancher.pins] == ["pin3"]
         assert brancher["pin3"]._connection == wg3["pin1"]
+
+
+class TestSubcircuitCache:
+    def test_cached_frequencies(self, wg1, wg2):
+        wg1.connect(wg2)
+        subcircuit = wg1.circuit.to_subcircuit(permanent=False)
+        freqs = np.linspace(190e12, 195e12, 5)
+
+        Subcircuit.clear_scache()
+        s1 = subcircuit.s_parameters(freqs)
+        assert sorted(Subcircuit.scache[wg1]) == list(freqs)
+
+        s2 = subcircuit.s_parameters(freqs[::-1])
+        assert np.array_equal(s1[::-1], s2)
+        Subcircuit.clear_scache()
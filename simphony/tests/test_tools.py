@@ -2,9 +2,12 @@
 # Licensed under the terms of the MIT License
 # (see simphony/__init__.py for details)
 
+import inspect
+
+import numpy as np
 import pytest
 
-from simphony.tools import str2float
+from simphony.tools import add_polar, str2float, str2float_array
 
 
 def test_wl2freq():
@@ -15,50 +18,60 @@ def test_freq2wl():
     pass
 
 
-class TestString2Float:
-    def test_no_suffix(self):
-        assert str2float("2.53") == 2.53
-
-    def test_femto(self):
-        assert str2float("17.83f") == 17.83e-15
-
-    def test_pico(self):
-        assert str2float("-15.37p") == -15.37e-12
-
-    def test_nano(self):
-        assert str2float("158.784n") == 158.784e-9
-
-    def test_micro(self):
-        assert str2float("15.26u") == 15.26e-06
+def test_add_polar_array():
+    r1, phi1 = np.array([1.0, 0.5, -0.3]), np.array([0.2, 7.5, -3.0])
+    r2, phi2 = np.array([0.1, 2.0, 0.9]), np.array([13.0, -1.0, 0.4])
+    mag, angle = add_polar((r1, phi1), (r2, phi2))
+    for i in range(3):
+        assert np.allclose(
+            (mag[i], angle[i]), add_polar((r1[i], phi1[i]), (r2[i], phi2[i]))
+        )
+
+
+# str2float is dominated by string handling, which numba can't compile and
+# runs in its slower object mode instead, so it should stay plain Python.
+def test_not_numba_wrapped():
+    # look through wrappers like lru_cache, stopping at a numba dispatcher
+    # (which would otherwise unwrap to the original Python function)
+    function = inspect.unwrap(
+        str2float, stop=lambda f: type(f).__name__ == "CPUDispatcher"
+    )
+    assert type(function).__name__ != "CPUDispatcher"
+
+
+STR2FLOAT_CASES = [
+    ("2.53", 2.53),
+    ("17.83f", 17.83e-15),
+    ("-15.37p", -15.37e-12),
+    ("158.784n", 158.784e-9),
+    ("15.26u", 15.26e-06),
+    ("-15.781m", -15.781e-3),
+    ("14.5c", 14.5e-2),
+    ("-0.257k", -0.257e3),
+    ("15.26M", 15.26e6),
+    ("-8.73G", -8.73e9),
+    ("183.4T", 183.4e12),
+    ("15.2e-6", 15.2e-6),
+    ("0.4E6", 0.4e6),
+]
 
-    def test_milli(self):
-        assert str2float("-15.781m") == -15.781e-3
 
-    def test_centi(self):
-        assert str2float("14.5c") == 14.5e-2
-
-    def test_kilo(self):
-        assert str2float("-0.257k") == -0.257e3
-
-    def test_Mega(self):
-        assert str2float("15.26M") == 15.26e6
-
-    def test_Giga(self):
-        assert str2float("-8.73G") == -8.73e9
-
-    def test_Tera(self):
-        assert str2float("183.4T") == 183.4e12
+class TestString2Float:
+    @pytest.mark.parametrize("num, expected", STR2FLOAT_CASES)
+    def test_str2float(self, num, expected):
+        assert str2float(num) == expected
 
-    def test_e(self):
-        assert str2float("15.2e-6") == 15.2e-6
+    def test_array_path(self):
+        nums = [num for num, _ in STR2FLOAT_CASES]
+        expected = [str2float(num) for num in nums]
+        assert np.array_equal(str2float_array(nums), expected)
 
-    def test_E(self):
-        assert str2float("0.4E6") == 0.4e6
+    def test_cache_identity(self):
+        assert str2float("158.784n") is str2float("158.784n")
 
-    def test_unrecognized(self):
+    @pytest.mark.parametrize("num", ["17.3o", "17.3.5e7", "1e5n", "1_000k", "nanm"])
+    def test_invalid(self, num):
         with pytest.raises(ValueError):
-            str2float("17.3o")
-
-    def test_malformed(self):
+            str2float(num)
         with pytest.raises(ValueError):
-            str2float("17.3.5e7")
+            str2float_array([num])
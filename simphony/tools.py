@@ -10,9 +10,9 @@ This package contains handy functions useful across simphony submodules
 and to the average user.
 """
 
-from cmath import rect
+from functools import lru_cache
+
 import numpy as np
-import re
 
 from scipy.constants import c as SPEED_OF_LIGHT
 from scipy.interpolate import interp1d
@@ -30,9 +30,13 @@ MATH_SUFFIXES = {
     "T": "e12",
 }
 
+# numbers with a suffix are plain fixed-point values, e.g. '-15.37p'
+_MANTISSA_CHARS = "+-.0123456789"
+
 
 def add_polar(c1, c2):
-    """Adds two polar coordinates together.
+    """Adds two polar coordinates together. The magnitudes and phases may
+    also be arrays, in which case the coordinates are added elementwise.
 
     Parameters
     ----------
@@ -49,16 +53,17 @@ def add_polar(c1, c2):
     r2, phi2 = c2
 
     # add the vectors in rectangular form
-    sum = rect(r1, phi1) + rect(r2, phi2)
-    mag = np.abs(sum)
-    angle = np.angle(sum)
+    real = r1 * np.cos(phi1) + r2 * np.cos(phi2)
+    imag = r1 * np.sin(phi1) + r2 * np.sin(phi2)
+    mag = np.hypot(real, imag)
+    angle = np.arctan2(imag, real)
 
     # calculate how many times the original vectors wrapped around
     # then add the biggest amount back to our phase
     # this simulates the steady-state in time-domain
     wrapped1 = (phi1 // (2 * np.pi)) * (2 * np.pi)
     wrapped2 = (phi2 // (2 * np.pi)) * (2 * np.pi)
-    biggest = max(wrapped1, wrapped2)
+    biggest = np.maximum(wrapped1, wrapped2)
 
     return (mag, angle + biggest)
 
@@ -83,6 +88,7 @@ def mul_polar(c1, c2):
     return (r1 * r2, phi1 + phi2)
 
 
+@lru_cache(maxsize=1024)
 def str2float(num):
     """Converts a number represented as a string to a float. Can include
     suffixes (such as 'u' for micro, 'k' for kilo, etc.).
@@ -102,6 +108,11 @@ def str2float(num):
     ValueError
         If the argument is malformed or the suffix is not recognized.
 
+    Notes
+    -----
+    Results are cached, since the same values are typically parsed many
+    times over (e.g. component parameters in netlists and data files).
+
     Examples
     --------
     >>> str2float('14.5c')
@@ -127,19 +138,47 @@ def str2float(num):
     >>> str2float('0.4E6')
     400000.0
     """
-    matches = re.findall(
-        r"([-+]?[0-9]+(?:[.][0-9]+)?)((?:[eE][-+]?[0-9]+)|(?:[a-zA-Z]))?", num
-    )
-    if len(matches) > 1:
-        raise ValueError("'{}' is malformed".format(num))
-    num, suffix = matches[0]
-    try:
-        if suffix.startswith("e") or suffix.startswith("E"):
-            return float(num + suffix)
-        else:
-            return float(num + (MATH_SUFFIXES[suffix] if suffix != "" else ""))
-    except KeyError as e:
-        raise ValueError("Suffix {} in '{}' not recognized.".format(str(e), matches[0]))
+    # a trailing letter is either a suffix, which is swapped for its exponent
+    # with a single lookup, or unrecognized; anything else is left to float()
+    num = num.strip()
+    suffix = num[-1:]
+    if suffix in MATH_SUFFIXES:
+        # float() also accepts exponents, underscores, 'nan' and 'inf',
+        # none of which can precede a suffix
+        if num[:-1].strip(_MANTISSA_CHARS):
+            raise ValueError("'{}' is malformed".format(num))
+        return float(num[:-1] + MATH_SUFFIXES[suffix])
+    if suffix.isalpha():
+        raise ValueError("Suffix '{}' in '{}' not recognized.".format(suffix, num))
+    return float(num)
+
+
+def str2float_array(nums):
+    """Converts a sequence of numbers represented as strings to an array of
+    floats, using the same rules as ``str2float``.
+
+    Parameters
+    ----------
+    nums : array_like of str
+        Strings representing numbers, optionally with suffixes.
+
+    Returns
+    -------
+    np.ndarray
+        The strings converted to floats, in the same shape as ``nums``.
+
+    Raises
+    ------
+    ValueError
+        If any string is malformed or has a suffix that is not recognized.
+
+    Examples
+    --------
+    >>> str2float_array(['14.5c', '2.53', '0.4E6'])
+    array([1.45e-01, 2.53e+00, 4.00e+05])
+    """
+    values = [str2float(num) for num in np.ravel(nums)]
+    return np.array(values, dtype=float).reshape(np.shape(nums))
 
 
 def freq2wl(freq):